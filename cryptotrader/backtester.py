@@ -1,9 +1,14 @@
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, List, Optional, Type
+from typing import Dict, Any, List, Optional, Tuple, Type
 from datetime import datetime
 import csv 
 import re
+import os
+import tempfile
+import sys
+from collections import namedtuple, defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 # IMPORTANT: Mock wrappers for external imports are used to maintain stability
 try:
@@ -26,78 +31,209 @@ except ImportError as e:
         def __init__(self, sd): self.symbol_data = sd
         def analyze_market(self, symbol): return {'trend': 'NEUTRAL', 'vwap': None, 'current_price': None}
 
-current_bar = None 
+from core.jit import njit, NUMBA_AVAILABLE
+
+# pyarrow (optional) enables the multi-threaded CSV parser and the Parquet data cache
+try:
+    import pyarrow
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# dtype of every backtest price/volume array. float32 would halve the bandwidth, but at BTC prices
+# (~1e5) its resolution (~0.008) is too coarse for scalping TP distances and the VWAP prefix sums.
+PRICE_DTYPE = np.float64
+
+# On a free-threaded interpreter (3.13t) threads run strategy checks in parallel; with the GIL they only add overhead
+FREE_THREADED = not getattr(sys, '_is_gil_enabled', lambda: True)()
+
+# Lightweight per-bar record built from the preloaded arrays (replaces a pandas Series per bar)
+Bar = namedtuple('Bar', 'name open high low close tick_volume')
+
+# Side for the int8 codes returned by Strategy.vectorize()
+SIGNAL_SIDES = {1: 'buy', -1: 'sell'}
+
+# --- Exit Scan Kernels ---
+
+def _find_exit_loop(closes: np.ndarray, start_idx: int, entry_price: float, sign: float, 
+                    tp_price_diff: float, sl_price_diff: float) -> Tuple[int, bool]:
+    """
+    Returns (exit_idx, hit_tp) for the first close from start_idx on that hits TP/SL, or (-1, False).
+    sign is +1.0 for a buy and -1.0 for a sell, so one PnL expression serves both sides.
+    """
+    for i in range(start_idx, len(closes)):
+        pnl_price_diff = sign * (closes[i] - entry_price)
+        if pnl_price_diff >= tp_price_diff: return i, True
+        if pnl_price_diff <= sl_price_diff: return i, False
+    return -1, False
+
+def _find_exit_vectorized(closes: np.ndarray, start_idx: int, entry_price: float, sign: float, 
+                          tp_price_diff: float, sl_price_diff: float) -> Tuple[int, bool]:
+    """NumPy equivalent of _find_exit_loop, used when numba is not installed."""
+    closes = closes[start_idx:]
+    pnl_price_diff = sign * (closes - entry_price)
+    tp_hits = pnl_price_diff >= tp_price_diff
+    sl_hits = pnl_price_diff <= sl_price_diff
+    tp_hit = int(np.argmax(tp_hits)) if tp_hits.any() else len(closes)
+    sl_hit = int(np.argmax(sl_hits)) if sl_hits.any() else len(closes)
+    if tp_hit == len(closes) and sl_hit == len(closes): return -1, False
+    return start_idx + min(tp_hit, sl_hit), tp_hit <= sl_hit
+
+# Compiled, the loop stops at the first hit instead of comparing every remaining bar
+find_exit = njit(cache=True)(_find_exit_loop) if NUMBA_AVAILABLE else _find_exit_vectorized
+
+# --- Strategy Driver ---
+
+def _build_strategy_driver(strategies: list):
+    """
+    Generates drive(symbol, market_state, positions) -> (strategy, signal) with one inlined
+    check_for_entry call per strategy, returning the first 'buy'/'sell' or (None, None).
+    The strategy list is fixed for a backtest, so the loop over it is unrolled once here.
+    """
+    args = ''.join(f", _s{k}=_s{k}, _check{k}=_check{k}" for k in range(len(strategies)))
+    lines = [f"def drive(symbol, market_state, positions{args}):"]
+    for k in range(len(strategies)):
+        lines.append(f"    signal = _check{k}(symbol, market_state, positions)")
+        lines.append(f"    if signal == 'buy' or signal == 'sell': return _s{k}, signal")
+    lines.append("    return None, None")
+    namespace = {}
+    for k, strategy in enumerate(strategies):
+        namespace[f"_s{k}"], namespace[f"_check{k}"] = strategy, strategy.check_for_entry
+    exec('\n'.join(lines), namespace)
+    return namespace['drive']
 
 # --- Mock Classes for Backtesting (Unchanged core logic) ---
 
 class MockTradeManager:
-    """Simulates the TradeManager for backtesting, including basic PnL calculation."""
-    def __init__(self, tp_points: float, sl_points: float): 
-        self.trades = []
+    """
+    Simulates the TradeManager for backtesting, including basic PnL calculation.
+    TP/SL exits are resolved once at entry: the remaining closes are scanned by find_exit
+    and the position is scheduled to close on the first bar that hits either level.
+    Open positions are stored as parallel NumPy arrays (slot k <-> open_positions[k]);
+    open_positions_by_symbol holds the same records as a tuple per symbol, rebuilt only when they change.
+    """
+    INITIAL_CAPACITY = 64
+    _POSITION_FIELDS = ('_entries', '_signs', '_magics', '_exit_idx', '_hit_tp')
+    LOG_COLUMNS = ('Event', 'Time', 'Side', 'Price', 'Entry_Price', 'Magic', 'Result')
+
+    def __init__(self, tp_points: float, sl_points: float, closes: np.ndarray): 
+        # Trade log kept column-wise; strings are only built for the report/export
+        self._log: Dict[str, list] = {col: [] for col in self.LOG_COLUMNS}
         self.open_positions = [] 
-        self.tp_price_diff = tp_points  
-        self.sl_price_diff = sl_points  
+        self.open_positions_by_symbol: Dict[str, tuple] = defaultdict(tuple)
+        self.tp_price_diff = PRICE_DTYPE(tp_points)  
+        self.sl_price_diff = PRICE_DTYPE(sl_points)  
         self.closed_trades_count = 0
+        self.closes = closes
+        self.current_bar: Optional[Bar] = None # Bar being processed, set by the backtest loop
+        self.current_idx = 0 # Bar index of current_bar
+        
+        # --- Open positions (SoA) ---
+        self._n = 0
+        self._entries = np.empty(self.INITIAL_CAPACITY, dtype=PRICE_DTYPE)
+        self._signs = np.empty(self.INITIAL_CAPACITY, dtype=np.float64) # +1.0 buy, -1.0 sell
+        self._magics = np.empty(self.INITIAL_CAPACITY, dtype=np.int64)
+        self._exit_idx = np.empty(self.INITIAL_CAPACITY, dtype=np.int64) # -1: no TP/SL hit within the data
+        self._hit_tp = np.empty(self.INITIAL_CAPACITY, dtype=np.bool_)
+        self._next_exit = -1 # Earliest scheduled exit bar, -1 if none
+        self._open_magics: set = set() # Magics with an open position (one position per magic)
     
     def place_order(self, symbol: str, side: str, volume: float, comment: str, magic: int):
-        global current_bar
-        if any(p['magic'] == magic for p in self.open_positions): return
+        current_bar = self.current_bar
+        if magic in self._open_magics: return
         if current_bar is not None:
-             position = {'symbol': symbol, 'type': 1 if side == 'buy' else 0, 'volume': volume, 'comment': comment, 'magic': magic, 'entry_price': current_bar.close, 'entry_time': current_bar.name}
+             sign = 1.0 if side == 'buy' else -1.0
+             exit_idx, hit_tp = find_exit(self.closes, self.current_idx + 1, current_bar.close, sign, 
+                                          self.tp_price_diff, self.sl_price_diff)
+             self._add_position(current_bar.close, sign, magic, exit_idx, hit_tp)
+             position = {'symbol': symbol, 'type': 1 if sign > 0 else 0, 'volume': volume, 'comment': comment, 'magic': magic, 'entry_price': current_bar.close, 'entry_time': current_bar.name}
              self.open_positions.append(position)
-             self.trades.append(f"Entry: {side.upper()} @ {current_bar.name} at {current_bar.close:.5f} (Magic: {magic})") 
+             self.open_positions_by_symbol[symbol] += (position,)
+             self._log_event('ENTRY', current_bar.name, side.upper(), current_bar.close, current_bar.close, magic, '')
+
+    def _add_position(self, entry_price: float, sign: float, magic: int, exit_idx: int, hit_tp: bool):
+        if self._n == len(self._entries):
+            for name in self._POSITION_FIELDS:
+                arr = getattr(self, name)
+                setattr(self, name, np.concatenate((arr, np.empty_like(arr))))
+        k = self._n
+        self._entries[k], self._signs[k], self._magics[k] = entry_price, sign, magic
+        self._exit_idx[k], self._hit_tp[k] = exit_idx, hit_tp
+        self._n += 1
+        self._open_magics.add(magic)
+        if exit_idx >= 0 and (self._next_exit < 0 or exit_idx < self._next_exit):
+            self._next_exit = exit_idx
 
-    def check_for_close(self, current_price: float, symbol: str):
-        closed_positions = []
+    def check_for_close(self, bar_idx: int):
+        if bar_idx != self._next_exit: return
+        n = self._n
+        hit = self._exit_idx[:n] == bar_idx
+        current_price = self.closes[bar_idx]
+        for k in np.flatnonzero(hit):
+            self._log_event('CLOSE', self.current_bar.name, 'BUY' if self._signs[k] > 0 else 'SELL', current_price, 
+                            self._entries[k], self._magics[k], 'TP' if self._hit_tp[k] else 'SL')
+            self.closed_trades_count += 1
+            self._open_magics.discard(int(self._magics[k]))
+
+        # Compact the arrays and the position records over the surviving slots (single pass each)
+        keep = ~hit
+        self._n = int(keep.sum())
+        for name in self._POSITION_FIELDS:
+            arr = getattr(self, name)
+            arr[:self._n] = arr[:n][keep]
+        self.open_positions = [pos for pos, kept in zip(self.open_positions, keep) if kept]
+        by_symbol = defaultdict(tuple)
         for pos in self.open_positions:
-            if pos['symbol'] != symbol: continue
-            if pos['type'] == 1: pnl_price_diff = current_price - pos['entry_price']
-            else: pnl_price_diff = pos['entry_price'] - current_price
-            
-            if pnl_price_diff >= self.tp_price_diff:
-                self.trades.append(f"Close: TP hit at {current_bar.name} (Entry: {pos['entry_price']:.5f}, Close: {current_price:.5f}) - PROFIT")
-                self.closed_trades_count += 1
-                closed_positions.append(pos)
-                continue
-            
-            if pnl_price_diff <= self.sl_price_diff:
-                self.trades.append(f"Close: SL hit at {current_bar.name} (Entry: {pos['entry_price']:.5f}, Close: {current_price:.5f}) - LOSS")
-                self.closed_trades_count += 1
-                closed_positions.append(pos)
-                continue
-        for pos in closed_positions: self.open_positions.remove(pos)
+            by_symbol[pos['symbol']] += (pos,)
+        self.open_positions_by_symbol = by_symbol
+
+        pending = self._exit_idx[:self._n]
+        pending = pending[pending >= 0]
+        self._next_exit = int(pending.min()) if len(pending) else -1
+
+    def _log_event(self, event: str, time, side: str, price: float, entry_price: float, magic: int, result: str):
+        for col, value in zip(self.LOG_COLUMNS, (event, time, side, price, entry_price, magic, result)):
+            self._log[col].append(value)
+
+    @property
+    def trades(self) -> List[str]:
+        """Human-readable trade log (Entries/Exits), formatted on demand."""
+        lines = []
+        for event, time, side, price, entry_price, magic, result in zip(*self._log.values()):
+            if event == 'ENTRY':
+                lines.append(f"Entry: {side} @ {time} at {price:.5f} (Magic: {magic})")
+            else:
+                outcome = 'PROFIT' if result == 'TP' else 'LOSS'
+                lines.append(f"Close: {result} hit at {time} (Entry: {entry_price:.5f}, Close: {price:.5f}) - {outcome}")
+        return lines
+
+    def trade_log_frame(self) -> pd.DataFrame:
+        """Trade log as a DataFrame, one row per entry/exit event."""
+        return pd.DataFrame(self._log, columns=list(self.LOG_COLUMNS))
 
 class MockSymbolData:
-    """Mocks the SymbolData class to return only the data slices needed and calculate indicators."""
+    """Mocks the SymbolData class to return only the bar arrays needed up to the current bar."""
     def __init__(self, df: pd.DataFrame): 
-        self.data_df = df
         self.current_idx = 0 
-    
-    def get_ohlc_bars(self, symbol: str, timeframe: int, count: int) -> pd.DataFrame:
-        if self.current_idx < 0: return pd.DataFrame()
-        start_idx = max(0, self.current_idx - count + 1)
-        end_idx = self.current_idx + 1 
-        df_slice = self.data_df.iloc[start_idx:end_idx].copy()
-        required_cols = ['open', 'high', 'low', 'close', 'tick_volume']
-        if all(col in df_slice.columns for col in required_cols): return df_slice[required_cols]
-        return pd.DataFrame()
-
-    def calculate_vwap(self, df: pd.DataFrame) -> Optional[np.ndarray]:
-        if 'tick_volume' not in df.columns or len(df) == 0 or df['tick_volume'].sum() == 0: return None
-        df['TypicalPrice'] = (df['high'] + df['low'] + df['close']) / 3
-        df['TPV'] = df['TypicalPrice'] * df['tick_volume']
-        df['CumTPV'] = df['TPV'].cumsum()
-        df['CumVolume'] = df['tick_volume'].cumsum()
-        vwap = df['CumTPV'] / df['CumVolume'].replace(0, np.nan) 
-        return vwap.to_numpy()
-
-    def calculate_support_resistance(self, df: pd.DataFrame) -> Dict[str, float]:
-        LOOKBACK_PERIOD = 50
-        if len(df) < LOOKBACK_PERIOD: 
-             return {"support": df['low'].min() if not df.empty else 0.0, 
-                     "resistance": df['high'].max() if not df.empty else 0.0}
-        recent_data = df.tail(LOOKBACK_PERIOD)
-        return {"support": recent_data['low'].min(), "resistance": recent_data['high'].max()}
+        # Per-column arrays for get_ohlc_arrays / get_last_bar_hl
+        self._time = df.index.to_numpy()
+        self._high, self._low, self._close, self._volume = (df[col].to_numpy() if not df.empty else np.empty(0) 
+                                                            for col in ('high', 'low', 'close', 'tick_volume'))
+
+    def get_ohlc_arrays(self, symbol: str, timeframe: int, count: int) -> Optional[Tuple[np.ndarray, ...]]:
+        if self.current_idx < 0: return None
+        window = slice(max(0, self.current_idx - count + 1), self.current_idx + 1)
+        return (self._time[window], self._high[window], self._low[window], 
+                self._close[window], self._volume[window])
+
+    def get_last_bar_time(self, symbol: str, timeframe: int) -> Optional[int]:
+        if self.current_idx < 0 or self.current_idx >= len(self._time): return None
+        return int(self._time[self.current_idx].astype('datetime64[s]').astype(np.int64))
+
+    def get_last_bar_hl(self, symbol: str, timeframe: int) -> Optional[Tuple[float, float, float]]:
+        if self.current_idx < 1: return None
+        idx = self.current_idx
+        return float(self._high[idx]), float(self._low[idx]), float(self._close[idx])
 
 
 class Backtester:
@@ -107,11 +243,20 @@ class Backtester:
         self.tp_points = tp_points
         self.sl_points = sl_points
         
-        self.trade_manager = MockTradeManager(tp_points, sl_points) 
-        
         self.data = self._load_and_clean_data(file_path) # Load data first
         self.symbol_data = MockSymbolData(self.data) 
         
+        # Contiguous per-column arrays (SoA) for the numeric hot paths
+        if self.data.empty:
+            ohlcv, self._bar_times = np.empty((0, 5), dtype=PRICE_DTYPE), np.empty(0, dtype=object)
+        else:
+            ohlcv = self.data[['open', 'high', 'low', 'close', 'tick_volume']].to_numpy(dtype=PRICE_DTYPE)
+            self._bar_times = self.data.index.to_pydatetime()
+        # Column views of the row-major block are strided; copy each into its own C-contiguous array
+        self._o, self._h, self._l, self._c, self._v = (np.ascontiguousarray(col, dtype=PRICE_DTYPE) for col in ohlcv.T)
+        
+        self.trade_manager = MockTradeManager(tp_points, sl_points, self._c) 
+        
         # Use GlobalVwapWatch as imported or the Mock version if import failed
         if 'GlobalVwapWatch' in globals() and GlobalVwapWatch.__name__ != 'GlobalVwapWatch':
             self.market_watch = GlobalVwapWatch(symbol_data=self.symbol_data)
@@ -119,6 +264,8 @@ class Backtester:
             self.market_watch = GlobalVwapWatch(symbol_data=self.symbol_data) # Use the fallback mock
             
         self.strategies = [s(self.trade_manager, self.symbol_data) for s in strategies]
+        self._drive = _build_strategy_driver(self.strategies)
+        self._strategy_pool: Optional[ThreadPoolExecutor] = None # Only set while run_backtest uses it
         
     def _load_and_clean_data(self, file_path: str) -> pd.DataFrame:
         """
@@ -126,13 +273,30 @@ class Backtester:
         Index = 'time' (datetime), Columns = 'open', 'high', 'low', 'close', 'tick_volume'.
         """
         print(f"\n--- Starting Data Load from Cleaned File: {file_path} ---")
+        required_cols = ['open', 'high', 'low', 'close', 'tick_volume']
+        # Parsed data is cached next to the CSV as Parquet and reused while the CSV is unchanged
+        parquet_path = file_path + '.parquet'
+        # (without the CSV the cache is not used either: the CSV load below reports the missing file)
+        if (PYARROW_AVAILABLE and os.path.exists(file_path) and os.path.exists(parquet_path) 
+                and os.path.getmtime(parquet_path) >= os.path.getmtime(file_path)):
+            try:
+                df = pd.read_parquet(parquet_path)
+            except Exception as e:
+                # Unreadable cache: fall back to the CSV (which also rewrites the cache)
+                print(f"Warning: Could not read Parquet cache '{parquet_path}': {e}")
+            else:
+                print(f"Data loaded successfully from cache {parquet_path}. Total bars: {len(df)}")
+                return df
+
         try:
             # Load the data, expecting the 'time' column to be the index and datetime formatted
+            # (index is set afterwards: the pyarrow engine does not combine index_col with parse_dates)
             df = pd.read_csv(
                 file_path, 
-                index_col='time', 
-                parse_dates=True
-            )
+                parse_dates=['time'],
+                dtype={col: PRICE_DTYPE for col in required_cols},
+                engine='pyarrow' if PYARROW_AVAILABLE else 'c'
+            ).set_index('time')
             
         except FileNotFoundError:
             print(f"❌ ERROR: Cleaned data file not found at '{file_path}'. Check filename.")
@@ -142,7 +306,6 @@ class Backtester:
             return pd.DataFrame()
 
         # Final check for required columns
-        required_cols = ['open', 'high', 'low', 'close', 'tick_volume']
         if not all(col in df.columns for col in required_cols):
              print(f"❌ Error: Cleaned DataFrame missing required OHLCV columns: {set(required_cols) - set(df.columns)}")
              return pd.DataFrame()
@@ -150,22 +313,35 @@ class Backtester:
         # Ensure correct column subset and types
         df = df[required_cols].copy()
         try:
-             df = df.astype(float)
+             df = df.astype(PRICE_DTYPE)
         except:
              print("Warning: Could not cast OHLCV columns to float. Proceeding with existing types.")
+
+        if PYARROW_AVAILABLE:
+            # Written to a temporary file and renamed into place, so parallel backtests
+            # loading the same CSV never read a half-written cache
+            tmp_path = None
+            try:
+                fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(parquet_path)), suffix='.parquet.tmp')
+                os.close(fd)
+                df.to_parquet(tmp_path)
+                os.replace(tmp_path, parquet_path)
+            except Exception as e:
+                print(f"Warning: Could not write Parquet cache '{parquet_path}': {e}")
+                if tmp_path is not None and os.path.exists(tmp_path):
+                    os.remove(tmp_path)
         
         print(f"Data loaded successfully. Total bars: {len(df)}")
         return df
 
 
-    def _run_trade_cycle(self, symbol: str, current_bar_data: pd.Series):
+    def _run_trade_cycle(self, symbol: str, current_bar_data: Bar, bar_idx: int):
         """Processes one bar of data through the market watch and strategies."""
-        global current_bar 
-        current_bar = current_bar_data 
+        self.trade_manager.current_bar = current_bar_data 
+        self.trade_manager.current_idx = bar_idx
         
-        # 1. PnL Check/Close
-        current_price = current_bar.close 
-        self.trade_manager.check_for_close(current_price, symbol)
+        # 1. PnL Check/Close (exits were scheduled when each position was opened)
+        self.trade_manager.check_for_close(bar_idx)
         
         # 2. Indicator Calculation (uses self.symbol_data.current_idx = i - 1)
         market_state = self.market_watch.analyze_market(symbol)
@@ -174,26 +350,67 @@ class Backtester:
         # Advance the index temporarily so strategies can see the full *current* bar (Bar i)
         self.symbol_data.current_idx += 1 
 
-        all_positions = self.trade_manager.open_positions
-        positions_for_symbol = tuple(p for p in all_positions if p['symbol'] == symbol)
+        positions_for_symbol = self.trade_manager.open_positions_by_symbol[symbol]
 
-        for strategy in self.strategies:
-            signal = strategy.check_for_entry(symbol, market_state, positions_for_symbol)
-            
-            if signal in ['buy', 'sell']:
-                magic_number = getattr(strategy, 'STRATEGY_MAGIC', STRATEGY_MAGIC)
-                self.trade_manager.place_order(symbol=symbol, side=signal, volume=DEFAULT_VOLUME, 
-                                               comment=f"{strategy.__class__.__name__}_{signal.upper()}", 
-                                               magic=magic_number)
-                break 
+        strategy, signal = self._first_signal(symbol, market_state, positions_for_symbol)
+        if strategy is not None:
+            self._place_signal(symbol, strategy, signal)
 
         # CRITICAL: Revert the index back for the next iteration's indicator calculation
         self.symbol_data.current_idx -= 1
         
+    def _first_signal(self, symbol: str, market_state: Dict[str, Any], positions_for_symbol: tuple):
+        """
+        Returns (strategy, signal) for the first strategy, in order, that signals 'buy'/'sell', else (None, None).
+        Sequentially the generated driver skips later strategies once one signals; on the strategy
+        pool all checks are submitted at once.
+        """
+        if self._strategy_pool is None:
+            return self._drive(symbol, market_state, positions_for_symbol)
+        futures = [self._strategy_pool.submit(s.check_for_entry, symbol, market_state, positions_for_symbol) 
+                   for s in self.strategies]
+        for strategy, future in zip(self.strategies, futures):
+            signal = future.result()
+            if signal in ['buy', 'sell']: return strategy, signal
+        return None, None
 
+    def _run_signal_cycle(self, symbol: str, current_bar_data: Bar, bar_idx: int, signals: np.ndarray):
+        """Fast path of _run_trade_cycle driven by signals precomputed with Strategy.vectorize()."""
+        self.trade_manager.current_bar = current_bar_data 
+        self.trade_manager.current_idx = bar_idx
+        
+        self.trade_manager.check_for_close(bar_idx)
+        
+        # Vectorized signals assume a flat book (single position per symbol constraint)
+        if self.trade_manager.open_positions_by_symbol[symbol]: return
 
-    def run_backtest(self, symbol: str = "BTCUSD"):
-        """Iterates through the data, simulating the trading environment bar by bar."""
+        for strategy, strategy_signals in zip(self.strategies, signals):
+            signal = SIGNAL_SIDES.get(int(strategy_signals[bar_idx]))
+            if signal:
+                self._place_signal(symbol, strategy, signal)
+                break
+
+    def _place_signal(self, symbol: str, strategy, signal: str):
+        magic_number = getattr(strategy, 'STRATEGY_MAGIC', STRATEGY_MAGIC)
+        self.trade_manager.place_order(symbol=symbol, side=signal, volume=DEFAULT_VOLUME, 
+                                       comment=f"{strategy.__class__.__name__}_{signal.upper()}", 
+                                       magic=magic_number)
+
+    def _precompute_signals(self) -> Optional[np.ndarray]:
+        """
+        Entry signals for every (strategy, bar) when all strategies provide a vectorize() classmethod.
+        Returns None otherwise, in which case the bar-by-bar check_for_entry loop is used.
+        """
+        if not self.strategies or not all(hasattr(s, 'vectorize') for s in self.strategies): return None
+        return np.vstack([s.vectorize(self._h, self._l, self._c, self._v) for s in self.strategies])
+
+
+    def run_backtest(self, symbol: str = "BTCUSD", report: bool = True):
+        """
+        Iterates through the data, simulating the trading environment bar by bar.
+        
+        :param report: Print the results summary at the end (off in run_parallel_backtests workers).
+        """
         print(f"\nStarting backtest for {symbol}...")
         
         if self.data.empty:
@@ -202,17 +419,30 @@ class Backtester:
 
         # Start past the minimum required bars for indicator calculation
         start_index = MARKET_WATCH_BAR_COUNT 
+        signals = self._precompute_signals()
+        if signals is None and FREE_THREADED and len(self.strategies) > 1:
+            self._strategy_pool = ThreadPoolExecutor(max_workers=len(self.strategies))
 
-        for i in range(start_index, len(self.data)):
-            
-            # Set index for indicator calculation on the NEXT line (Bar i-1)
-            self.symbol_data.current_idx = i - 1 
-            
-            current_bar_data = self.data.iloc[i]
-            current_bar_data.name = current_bar_data.name.to_pydatetime() 
-            
-            self._run_trade_cycle(symbol, current_bar_data)
+        try:
+            for i in range(start_index, len(self.data)):
+                
+                # Set index for indicator calculation on the NEXT line (Bar i-1)
+                self.symbol_data.current_idx = i - 1 
+                
+                current_bar_data = Bar(self._bar_times[i], self._o[i], self._h[i], self._l[i], self._c[i], self._v[i])
+                
+                if signals is not None:
+                    self._run_signal_cycle(symbol, current_bar_data, i, signals)
+                else:
+                    self._run_trade_cycle(symbol, current_bar_data, i)
+        finally:
+            if self._strategy_pool is not None:
+                self._strategy_pool.shutdown()
+                self._strategy_pool = None
             
+        if not report:
+            return
+
         # Final Report
         t = self.trade_manager.closed_trades_count
         print("\n" + "="*50); print("📊 BACKTEST RESULTS SUMMARY 📊"); print("="*50)
@@ -224,6 +454,31 @@ class Backtester:
         print("="*50)
 
 
+def _run_single(file_path: str, strategy_cls: Type, tp_points: float, sl_points: float, symbol: str) -> List[str]:
+    """Runs one strategy in isolation (top-level so it can be pickled for worker processes)."""
+    tester = Backtester(file_path, [strategy_cls], tp_points=tp_points, sl_points=sl_points)
+    tester.run_backtest(symbol=symbol, report=False) # The parent prints the results, so worker output does not interleave
+    return tester.trade_manager.trades
+
+
+def run_parallel_backtests(file_path: str, strategies: List[Type], tp_points: float, sl_points: float, 
+                           symbol: str = "BTCUSD", max_workers: Optional[int] = None) -> Dict[str, List[str]]:
+    """
+    Backtests each strategy independently, one worker process per strategy.
+    
+    Workers receive only the file path and load the CSV themselves, so the DataFrame is never pickled.
+    Unlike Backtester.run_backtest, strategies do not share a trade manager here.
+    
+    :return: {strategy class name: trade log}
+    """
+    max_workers = max_workers or min(len(strategies), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as ex:
+        results = list(ex.map(_run_single, [file_path] * len(strategies), strategies, 
+                              [tp_points] * len(strategies), [sl_points] * len(strategies), 
+                              [symbol] * len(strategies)))
+    return {s.__name__: trades for s, trades in zip(strategies, results)}
+
+
 if __name__ == '__main__':
     
     # Use a safe mock wrapper for strategy logic
@@ -232,6 +487,13 @@ if __name__ == '__main__':
         def __init__(self, trade_manager, symbol_data):
             self.trade_manager = trade_manager
             self.symbol_data = symbol_data
+        @classmethod
+        def vectorize(cls, high, low, close, volume):
+            try:
+                from strategies.vwap_trend_continuation import VwapTrendContinuation as RealStrategy
+                return RealStrategy.vectorize(high, low, close, volume)
+            except ImportError:
+                 return np.zeros(len(close), dtype=np.int8)
         def check_for_entry(self, symbol, market_state, open_positions):
             try:
                 # Attempt to import the real strategy logic for execution
@@ -252,21 +514,32 @@ if __name__ == '__main__':
         TP_POINTS_FOR_SCALPING = 1.5    # $1.50 price change to hit TP
         SL_POINTS = -10.0             # -$10.00 price change to hit SL
         
-        tester = Backtester(file_path, STRATEGIES_TO_TEST, 
-                            tp_points=TP_POINTS_FOR_SCALPING, 
-                            sl_points=SL_POINTS)
-        tester.run_backtest(symbol="BTCUSD") 
+        if '--parallel' in sys.argv:
+            # Each strategy backtested on its own, one worker process per strategy.
+            # Workers need importable (picklable) classes, so the real strategies are passed, not the wrapper.
+            results = run_parallel_backtests(file_path, [VwapTrendContinuation], 
+                                             tp_points=TP_POINTS_FOR_SCALPING, 
+                                             sl_points=SL_POINTS, symbol="BTCUSD")
+            for name, trades in results.items():
+                print("\n" + "="*50); print(f"📊 {name} RESULTS 📊"); print("="*50)
+                print(f"Total Trades Closed: **{sum(1 for t in trades if t.startswith('Close'))}**")
+                for trade_log in trades:
+                     print(f"- {trade_log}")
+                print("="*50)
+        else:
+            tester = Backtester(file_path, STRATEGIES_TO_TEST, 
+                                tp_points=TP_POINTS_FOR_SCALPING, 
+                                sl_points=SL_POINTS)
+            tester.run_backtest(symbol="BTCUSD") 
         
-        # --- EXPORT TRADE LOG TO CSV FOR ANALYSIS ---
-        if tester.trade_manager.trades:
-            log_file = 'trade_log.csv'
+            # --- EXPORT TRADE LOG TO CSV FOR ANALYSIS ---
+            trade_log_df = tester.trade_manager.trade_log_frame()
+            if not trade_log_df.empty:
+                log_file = 'trade_log.csv'
             
-            # Simple Text Export
-            with open(log_file, 'w', newline='') as f:
-                 f.write("Trade_Log_Entry\n")
-                 for trade_log in tester.trade_manager.trades:
-                     f.write(f'"{trade_log}"\n')
-            print(f"\nTrade log saved to {log_file} for detailed analysis.")
+                # Columnar Export (one row per entry/exit event)
+                trade_log_df.to_csv(log_file, index=False)
+                print(f"\nTrade log saved to {log_file} for detailed analysis.")
         # --------------------------------------------
         
     except Exception as e:
@@ -0,0 +1,15 @@
+# core/jit.py
+
+# Optional Numba support: kernels decorated with njit compile to native code when
+# numba is installed and run as plain Python otherwise.
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (supports both @njit and @njit(...))."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
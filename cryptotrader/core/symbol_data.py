@@ -2,22 +2,63 @@
 
 import MetaTrader5 as mt5
 import pandas as pd
-from typing import Optional, List, Dict
+import time
+import logging
+from typing import Optional, List, Dict, Tuple, Any
 import numpy as np
 
+logger = logging.getLogger(__name__)
+
 class SymbolData:
     """Utility class for fetching data and calculating indicators."""
 
     def __init__(self):
-        # A simple cache can be added here if performance is critical
-        pass
+        # Last tick per symbol with the monotonic time it was fetched
+        # Format: {symbol: (fetched_at, tick)}
+        self._tick_cache: Dict[str, Tuple[float, Any]] = {}
+        # Rates fetched during the current cycle, shared by the market watch and all strategies.
+        # None (no caching) until begin_cycle() is called. Format: {(symbol, timeframe): (bars requested, rates)}
+        self._bar_cache: Optional[Dict[Tuple[str, int], Tuple[int, np.ndarray]]] = None
+
+    def begin_cycle(self):
+        """Starts a new main loop cycle: bars fetched from now on are reused until the next call."""
+        self._bar_cache = {}
+
+    def _get_rates(self, symbol: str, timeframe: int, count: int) -> Optional[np.ndarray]:
+        """Last count rates from MT5 (record array), served from the cycle cache when it holds enough."""
+        cache = self._bar_cache
+        if cache is None:
+            return mt5.copy_rates_from_pos(symbol, timeframe, 0, count)
+        
+        cached = cache.get((symbol, timeframe))
+        if cached is not None and cached[0] >= count:
+            # Requested at least count bars already (fewer may exist in the history)
+            return cached[1][-count:]
+        
+        # Only count bars are fetched, so one-bar reads stay one-bar RPCs; a larger request replaces the entry
+        rates = mt5.copy_rates_from_pos(symbol, timeframe, 0, count)
+        if rates is None:
+            return None
+        cache[(symbol, timeframe)] = (count, rates)
+        return rates
+
+    def get_tick(self, symbol: str, max_age_ms: float = 100):
+        """Returns mt5.symbol_info_tick(symbol), reusing a tick fetched less than max_age_ms ago."""
+        now = time.monotonic()
+        cached = self._tick_cache.get(symbol)
+        if cached is not None and (now - cached[0]) * 1000 < max_age_ms:
+            return cached[1]
+        tick = mt5.symbol_info_tick(symbol)
+        if tick is not None:
+            self._tick_cache[symbol] = (now, tick)
+        return tick
 
     def get_ohlc_bars(self, symbol: str, timeframe: int, count: int) -> Optional[pd.DataFrame]:
         """Fetches OHLC data from MT5 and returns a pandas DataFrame."""
         try:
-            bars = mt5.copy_rates_from_pos(symbol, timeframe, 0, count)
+            bars = self._get_rates(symbol, timeframe, count)
             if bars is None or len(bars) == 0:
-                print(f"Error fetching data for {symbol}: {mt5.last_error()}")
+                logger.error("Error fetching data for %s: %s", symbol, mt5.last_error())
                 return None
                 
             df = pd.DataFrame(bars)
@@ -25,7 +66,48 @@ class SymbolData:
             df.set_index('time', inplace=True)
             return df
         except Exception as e:
-            print(f"An error occurred in get_ohlc_bars: {e}")
+            logger.error("An error occurred in get_ohlc_bars: %s", e)
+            return None
+
+    def get_ohlc_arrays(self, symbol: str, timeframe: int, count: int) -> Optional[Tuple[np.ndarray, ...]]:
+        """
+        (time, high, low, close, tick_volume) of the last count bars as field views of the MT5 rates
+        array: no copy, no DataFrame/DatetimeIndex construction. time is in epoch seconds.
+        """
+        try:
+            rates = self._get_rates(symbol, timeframe, count)
+            if rates is None or len(rates) == 0:
+                logger.error("Error fetching data for %s: %s", symbol, mt5.last_error())
+                return None
+            return rates['time'], rates['high'], rates['low'], rates['close'], rates['tick_volume']
+        except Exception as e:
+            logger.error("An error occurred in get_ohlc_arrays: %s", e)
+            return None
+
+    def get_last_bar_time(self, symbol: str, timeframe: int) -> Optional[int]:
+        """Open time (epoch seconds) of the current bar, from a single-bar rates fetch."""
+        try:
+            rates = self._get_rates(symbol, timeframe, 1)
+            if rates is None or len(rates) == 0:
+                return None
+            return int(rates['time'][-1])
+        except Exception as e:
+            logger.error("An error occurred in get_last_bar_time: %s", e)
+            return None
+
+    def get_last_bar_hl(self, symbol: str, timeframe: int) -> Optional[Tuple[float, float, float]]:
+        """
+        (high, low, close) of the current bar, read straight from the MT5 rates array (no DataFrame).
+        Returns None unless at least 2 bars are available, as callers of get_ohlc_bars(count=2) expect.
+        """
+        try:
+            rates = self._get_rates(symbol, timeframe, 2)
+            if rates is None or len(rates) < 2:
+                return None
+            last = rates[-1]
+            return float(last['high']), float(last['low']), float(last['close'])
+        except Exception as e:
+            logger.error("An error occurred in get_last_bar_hl: %s", e)
             return None
 
     def calculate_vwap(self, df: pd.DataFrame) -> Optional[np.ndarray]:
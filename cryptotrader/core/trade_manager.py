@@ -1,19 +1,48 @@
 # core/trade_manager.py
 
 import MetaTrader5 as mt5
+import threading
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Tuple
 from persistence.trade_log import TradeLog
+from core.symbol_data import SymbolData
 from config.settings import MT5_MAGIC_NUMBER, DEFAULT_DEVIATION, DEFAULT_VOLUME
 
+logger = logging.getLogger(__name__)
+
+# Orders sent at the same time by flush()
+ORDER_WORKERS = 8
+
 class TradeManager:
     """Centralized trade placement logic."""
     
-    def __init__(self, logger: TradeLog, deviation=DEFAULT_DEVIATION, magic=MT5_MAGIC_NUMBER):
+    def __init__(self, logger: TradeLog, deviation=DEFAULT_DEVIATION, magic=MT5_MAGIC_NUMBER, 
+                 symbol_data: Optional[SymbolData] = None):
         self.logger = logger
+        # Source of ticks; shared with the strategies so recent ticks are not fetched twice
+        self.symbol_data = symbol_data if symbol_data is not None else SymbolData()
         self.deviation = deviation
         self.magic = magic
         # NOTE: SL and TP are handled by PnLManager, so we enforce 0.0 for MT5
         self.sl = 0.0 
         self.tp = 0.0
+        # Orders queued by enqueue_order until the next flush(); requests are built when sent
+        # Format: [(symbol, side, volume, comment, magic)]
+        self._pending: List[Tuple[str, str, float, str, Optional[int]]] = []
+        self._pending_lock = threading.Lock() # Strategies for different symbols run concurrently
+        self._order_pool = ThreadPoolExecutor(max_workers=ORDER_WORKERS) # Sends the orders of each flush()
+        # Symbols already added to MarketWatch (mt5.symbol_select is only needed once per symbol)
+        self._selected: set = set()
+
+    def select_symbol(self, symbol: str) -> bool:
+        """Selects the symbol in MarketWatch unless already done. Returns False if MT5 rejects it."""
+        if symbol in self._selected:
+            return True
+        if not mt5.symbol_select(symbol, True):
+            return False
+        self._selected.add(symbol)
+        return True
 
     def place_order(self, symbol: str, side: str, volume: float, comment: str,magic: int = None):
         """
@@ -25,13 +54,69 @@ class TradeManager:
         :param comment: Strategy or trade identifier
         :return: Order ticket number on success, None on failure
         """
-        if not mt5.symbol_select(symbol, True):
-            print(f"❌ Failed to select symbol {symbol}")
+        request = self._build_order_request(symbol, side, volume, comment, magic)
+        if request is None:
+            return None
+        
+        # Send the order
+        result = mt5.order_send(request)
+        return self._handle_order_result(result, request, side)
+
+    def enqueue_order(self, symbol: str, side: str, volume: float, comment: str, magic: int = None) -> bool:
+        """
+        Same as place_order, but the order is only queued; flush() prices and sends every queued order at once.
+        
+        :return: True if the order was queued, False if the side is invalid
+        """
+        if side.lower() not in ("buy", "sell"):
+            logger.error("Invalid side: %s", side)
+            return False
+        with self._pending_lock:
+            self._pending.append((symbol, side, volume, comment, magic))
+        return True
+
+    def flush(self) -> List[Optional[int]]:
+        """
+        Sends all queued orders concurrently (MT5 calls release the GIL), so placing N orders
+        takes about as long as the slowest one instead of their sum.
+        
+        :return: Ticket number (or None on failure) per queued order, in queue order
+        """
+        with self._pending_lock:
+            pending, self._pending = self._pending, []
+        if not pending:
+            return []
+        
+        sent = list(self._order_pool.map(self._send_order, pending))
+        return [self._handle_order_result(*order) if order is not None else None for order in sent]
+
+    def _send_order(self, order: Tuple[str, str, float, str, Optional[int]]):
+        """
+        Builds the request at the current tick and sends it (runs on the order pool).
+        Returns (result, request, side, error), or None if the request could not be built.
+        """
+        symbol, side, volume, comment, magic = order
+        request = self._build_order_request(symbol, side, volume, comment, magic)
+        if request is None:
+            return None
+        result = mt5.order_send(request)
+        # Without a result, last_error() is the only description; read it right after this thread's call
+        error = mt5.last_error() if result is None else None
+        return result, request, side, error
+
+    def close(self):
+        """Stops the order pool (pending orders that were never flushed are dropped)."""
+        self._order_pool.shutdown(wait=True)
+
+    def _build_order_request(self, symbol: str, side: str, volume: float, comment: str, magic: int) -> Optional[Dict[str, Any]]:
+        """Market order request at the current tick, or None if the symbol/tick/side is invalid."""
+        if not self.select_symbol(symbol):
+            logger.error("❌ Failed to select symbol %s", symbol)
             return None
             
-        tick = mt5.symbol_info_tick(symbol)
+        tick = self.symbol_data.get_tick(symbol)
         if tick is None:
-            print(f"❌ Failed to get tick info for {symbol}")
+            logger.error("❌ Failed to get tick info for %s", symbol)
             return None
 
         # Determine the execution price and trade type
@@ -44,7 +129,7 @@ class TradeManager:
             order_type = mt5.ORDER_TYPE_SELL
             action = mt5.TRADE_ACTION_DEAL
         else:
-            print(f"Invalid side: {side}")
+            logger.error("Invalid side: %s", side)
             return None
 
         # --- MT5 Request Dictionary ---
@@ -61,21 +146,29 @@ class TradeManager:
             "comment": comment,
             "type_filling": mt5.ORDER_FILLING_IOC, # Immediate-or-Cancel
         }
-        
-        # Send the order
-        result = mt5.order_send(request)
+        return request
+
+    def _handle_order_result(self, result, request: Dict[str, Any], side: str, error=None) -> Optional[int]:
+        """
+        Logs an order_send result and returns the ticket on success, None on failure.
+        error is the last_error() read by the sending thread when order_send returned no result.
+        """
+        symbol, price = request["symbol"], request["price"]
         
         # Log the result
-        self.logger.log_trade_placement(result, symbol, side, volume, price, self.sl, self.tp, comment)
+        self.logger.log_trade_placement(result, symbol, side, request["volume"], price, self.sl, self.tp, request["comment"])
         
         if result and result.retcode == mt5.TRADE_RETCODE_DONE:
             ticket = result.order
-            print(f"✅ {side.upper()} order placed for {symbol} at {price}. Ticket: {ticket}")
+            logger.info("✅ %s order placed for %s at %s. Ticket: %s", side.upper(), symbol, price, ticket)
             return ticket
         else:
-            error_code = result.retcode if result else "N/A"
-            error_desc = mt5.last_error()
-            print(f"❌ Order failed ({error_code}): {error_desc}")
+            # Each result carries its own retcode/comment; last_error() is shared by every thread
+            if result:
+                error_code, error_desc = result.retcode, result.comment
+            else:
+                error_code, error_desc = "N/A", error if error is not None else mt5.last_error()
+            logger.error("❌ Order failed (%s): %s", error_code, error_desc)
             return None
             
     def close_position(self, position_info, reason: str):
@@ -86,14 +179,19 @@ class TradeManager:
         symbol = position_info.symbol
         volume = position_info.volume
         
+        tick = self.symbol_data.get_tick(symbol)
+        if tick is None:
+            logger.error("❌ Failed to get tick info for %s", symbol)
+            return None
+        
         if position_info.type == mt5.ORDER_TYPE_BUY:
             trade_type = mt5.ORDER_TYPE_SELL
-            close_price = mt5.symbol_info_tick(symbol).bid
+            close_price = tick.bid
         elif position_info.type == mt5.ORDER_TYPE_SELL:
             trade_type = mt5.ORDER_TYPE_BUY
-            close_price = mt5.symbol_info_tick(symbol).ask
+            close_price = tick.ask
         else:
-            print(f"Error: Unknown position type {position_info.type} for ticket {ticket}")
+            logger.error("Error: Unknown position type %s for ticket %s", position_info.type, ticket)
             return None
 
         request = {
@@ -114,8 +212,8 @@ class TradeManager:
         self.logger.log_position_close(position_info, result, reason)
         
         if result and result.retcode == mt5.TRADE_RETCODE_DONE:
-            print(f"  [Close] ✅ Position {ticket} closed successfully. Reason: {reason}")
+            logger.info("  [Close] ✅ Position %s closed successfully. Reason: %s", ticket, reason)
         else:
-            print(f"  [Close] ❌ Failed to close position {ticket}. Error: {mt5.last_error()}")
+            logger.error("  [Close] ❌ Failed to close position %s. Error: %s", ticket, mt5.last_error())
             
         return result
\ No newline at end of file
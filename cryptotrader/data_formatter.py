@@ -3,6 +3,14 @@
 import pandas as pd
 import numpy as np
 
+# pyarrow (optional) enables the multi-threaded CSV reader/writer
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 def clean_mt5_data(input_path: str, output_path: str) -> None:
     """
     Loads malformed MT5 export data, cleans and formats columns, 
@@ -13,8 +21,11 @@ def clean_mt5_data(input_path: str, output_path: str) -> None:
     but the resulting data will only reflect the 1st of each month.
     """
     try:
-        # Load the tab-delimited data
-        df = pd.read_csv(input_path, delimiter='\t')
+        # Load the tab-delimited data (only the columns kept below; date/time stay raw strings)
+        df = pd.read_csv(input_path, delimiter='\t', 
+                         usecols=['<DATE>', '<TIME>', '<OPEN>', '<HIGH>', '<LOW>', '<CLOSE>', '<TICKVOL>'],
+                         dtype={'<DATE>': str, '<TIME>': str},
+                         engine='pyarrow' if PYARROW_AVAILABLE else 'c')
     except Exception as e:
         print(f"Error reading CSV: {e}")
         return
@@ -30,26 +41,25 @@ def clean_mt5_data(input_path: str, output_path: str) -> None:
         '<TICKVOL>': 'tick_volume'
     }, inplace=True)
 
-    # 2. Extract YYYY.MM and combine with time_of_day, forcing day to '01'
-    def combine_and_force_day(row):
-        date_part = str(row['date_raw'])
-        time_part = str(row['time_of_day'])
-        
-        # Use string splitting, which is robust for the format 'ID.YYYY.MM'
-        parts = date_part.split('.')
-        
-        if len(parts) >= 3:
-             # Take YYYY (parts[1]) and MM (parts[2])
-             year_month = f"{parts[1]}.{parts[2]}"
-             # Force day '01'
-             date_str_forced = year_month + '.01' 
-             return date_str_forced + ' ' + time_part
-        return np.nan
-
-    df['datetime_str'] = df.apply(combine_and_force_day, axis=1)
+    # 2. Extract YYYY.MM as integers, forcing day to '01'
+    # Vectorized string splitting, which is robust for the format 'ID.YYYY.MM'
+    # (rows with fewer parts get NaN and are dropped after parsing)
+    parts = df['date_raw'].astype(str).str.split('.', expand=True).reindex(columns=[1, 2])
+    month_start = pd.to_datetime(pd.DataFrame({
+        'year': pd.to_numeric(parts[1], errors='coerce'),   # YYYY (parts[1])
+        'month': pd.to_numeric(parts[2], errors='coerce'),  # MM (parts[2])
+        'day': 1
+    }), errors='coerce')
 
-    # 3. Parse the combined string into a datetime object (Format: YYYY.MM.DD HH:MM:SS)
-    df['time'] = pd.to_datetime(df['datetime_str'], format='%Y.%m.%d %H:%M:%S', errors='coerce')
+    # 3. Add time_of_day (HH:MM:SS) as a numeric offset, without a datetime string round-trip
+    # (out-of-range fields become NaT instead of rolling over into the next hour/day)
+    hms = df['time_of_day'].astype(str).str.split(':', expand=True).reindex(columns=[0, 1, 2])
+    h = pd.to_numeric(hms[0], errors='coerce')
+    m = pd.to_numeric(hms[1], errors='coerce')
+    s = pd.to_numeric(hms[2], errors='coerce')
+    offset = pd.to_timedelta(h * 3600 + m * 60 + s, unit='s')
+    offset[(h < 0) | (m < 0) | (s < 0) | (h > 23) | (m > 59) | (s > 59)] = pd.NaT
+    df['time'] = month_start + offset
 
     # 4. Clean up and select final columns
     df.dropna(subset=['time'], inplace=True)
@@ -59,7 +69,10 @@ def clean_mt5_data(input_path: str, output_path: str) -> None:
     df_cleaned = df[['open', 'high', 'low', 'close', 'tick_volume']].copy()
 
     # 5. Save the cleaned DataFrame
-    df_cleaned.to_csv(output_path)
+    if PYARROW_AVAILABLE:
+        pacsv.write_csv(pa.Table.from_pandas(df_cleaned.reset_index(), preserve_index=False), output_path)
+    else:
+        df_cleaned.to_csv(output_path)
     print(f"Cleaned data saved to {output_path}")
 
 if __name__ == '__main__':
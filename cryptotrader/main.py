@@ -2,8 +2,13 @@
 
 import MetaTrader5 as mt5
 import time
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
-from typing import Tuple
+from typing import Tuple, List
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # --- Import Core Components ---
 from persistence.trade_log import TradeLog
@@ -16,7 +21,39 @@ from config.settings import TRADING_SYMBOLS
 # --- Import Strategies ---
 from strategies.RSI_HVT import RsiMeanReversion
 from strategies.AdaptativeScalper import AdaptiveVolatilityScalper
+logger = logging.getLogger(__name__)
+
+def _start_log_listener() -> QueueListener:
+    """
+    Routes all logging through a queue drained by a background thread, so the trading
+    loop never blocks on stdout. Returns the started listener (stop() flushes it).
+    """
+    log_queue = queue.SimpleQueue()
+    logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(log_queue)])
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = QueueListener(log_queue, stream_handler)
+    listener.start()
+    return listener
+
 # --- Main Logic ---
+def _process_symbol(symbol: str, market_watch: GlobalVwapWatch, strategies: List, positions_for_symbol: Tuple):
+    """Runs market analysis and every strategy for one symbol (executed on the symbol pool)."""
+    logger.info("\n--- Processing %s ---", symbol)
+    
+    # 1. Global Market Analysis for the current symbol
+    market_state = market_watch.analyze_market(symbol)
+    
+    # Print analysis only for active symbols
+    if market_state.get('vwap') is not None:
+        logger.info("♥")
+        market_watch.print_analysis(market_state)
+
+    # 2. Strategy Execution
+    for strategy in strategies:
+        # Pass the symbol, market state, and only relevant positions
+        strategy.check_for_entry(symbol, market_state, positions_for_symbol)
+
 def main_loop(loop_interval=5):
     """
     The main execution loop that initializes the bot and coordinates all components 
@@ -24,79 +61,94 @@ def main_loop(loop_interval=5):
     """
     
     if not TRADING_SYMBOLS:
-        print("❌ ERROR: TRADING_SYMBOLS list in config/settings.py is empty. Cannot run.")
+        logger.error("❌ ERROR: TRADING_SYMBOLS list in config/settings.py is empty. Cannot run.")
         return
 
     # 1. Initialize MT5 Connection
     if not mt5.initialize():
-        print(f"❌ MT5 Initialization failed. Error: {mt5.last_error()}")
+        logger.error("❌ MT5 Initialization failed. Error: %s", mt5.last_error())
         return
 
-    print("✅ MetaTrader5 connection established.")
+    logger.info("✅ MetaTrader5 connection established.")
 
     # 2. Initialize Managers and Utilities
     trade_logger = TradeLog()
     symbol_data = SymbolData()
-    trade_manager = TradeManager(logger=trade_logger)
+    trade_manager = TradeManager(logger=trade_logger, symbol_data=symbol_data)
     market_watch = GlobalVwapWatch(symbol_data=symbol_data)
     
+    # Add every symbol to MarketWatch once, instead of on every order
+    for symbol in TRADING_SYMBOLS:
+        if not trade_manager.select_symbol(symbol):
+            logger.error("❌ Failed to select symbol %s. Error: %s", symbol, mt5.last_error())
+            trade_manager.close()
+            trade_logger.close() # Releases the trade log file handle, as the main loop's finally does
+            mt5.shutdown()
+            return
+    
     # 3. Initialize Strategies (No symbols passed here, they are passed during execution)
     strategies = [
         RsiMeanReversion(trade_manager, symbol_data),
         AdaptiveVolatilityScalper(trade_manager, symbol_data)
     ]
-    print(f"🤖 Initialized {len(strategies)} trading strategies for {len(TRADING_SYMBOLS)} symbols.")
-    print("-" * 50)
+    logger.info("🤖 Initialized %d trading strategies for %d symbols.", len(strategies), len(TRADING_SYMBOLS))
+    logger.info("-" * 50)
+    
+    # Symbols are processed concurrently: each one mostly waits on MT5 IPC calls, which release the GIL
+    symbol_pool = ThreadPoolExecutor(max_workers=min(16, len(TRADING_SYMBOLS)))
     
     # 4. Core Execution Loop
     try:
         while True:
             start_time = time.time()
-            print(f"\n--- Cycle Start: {datetime.now().strftime('%H:%M:%S')} ---")
+            symbol_data.begin_cycle() # Bars are fetched at most once per symbol and timeframe this cycle
+            logger.info("\n--- Cycle Start: %s ---", datetime.now().strftime('%H:%M:%S'))
             
             # A. Get ALL Current Open Positions globally once per cycle
             all_positions: Tuple[mt5.TradePosition] = mt5.positions_get()
             if all_positions is None:
                 all_positions = tuple()
             
-            # C. Iterate through ALL Configured Symbols
-            for symbol in TRADING_SYMBOLS:
-                
-                print(f"\n--- Processing {symbol} ---")
-                
-                # 1. Global Market Analysis for the current symbol
-                market_state = market_watch.analyze_market(symbol)
-                
-                # Print analysis only for active symbols
-                if market_state.get('vwap') is not None:
-                    print("♥")
-                    market_watch.print_analysis(market_state)
-
-                # 2. Filter positions relevant to the current symbol for strategy checks
-                positions_for_symbol = tuple(p for p in all_positions if p.symbol == symbol)
-                
-                # 3. Strategy Execution
-                for strategy in strategies:
-                    # Pass the symbol, market state, and only relevant positions
-                    strategy.check_for_entry(symbol, market_state, positions_for_symbol)
+            # B. Bucket positions by symbol in one pass (instead of filtering all positions per symbol)
+            positions_by_symbol = defaultdict(list)
+            for p in all_positions:
+                positions_by_symbol[p.symbol].append(p)
+            positions_by_symbol = {symbol: tuple(group) for symbol, group in positions_by_symbol.items()}
+            
+            # C. Process ALL Configured Symbols concurrently
+            futures = {symbol_pool.submit(_process_symbol, symbol, market_watch, strategies, 
+                                          positions_by_symbol.get(symbol, ())): symbol 
+                       for symbol in TRADING_SYMBOLS}
+            for future in as_completed(futures):
+                future.result() # Re-raises a symbol's exception here, as the sequential loop did
+            
+            # Send the orders the strategies queued this cycle in one concurrent batch
+            trade_manager.flush()
             
             # D. Control Loop Timing
             end_time = time.time()
             elapsed_time = end_time - start_time
             sleep_time = max(0, loop_interval - elapsed_time)
             
-            print(f"\nCycle completed in {elapsed_time:.2f}s. Sleeping for {sleep_time:.2f}s.")
+            logger.info("\nCycle completed in %.2fs. Sleeping for %.2fs.", elapsed_time, sleep_time)
             time.sleep(sleep_time)
 
     except KeyboardInterrupt:
-        print("\n👋 Position manager stopped by user.")
+        logger.info("\n👋 Position manager stopped by user.")
     except Exception as e:
-        print(f"\n❌ An unexpected error occurred: {e}")
+        logger.error("\n❌ An unexpected error occurred: %s", e)
     finally:
+        symbol_pool.shutdown(wait=True)
+        trade_manager.close()
+        trade_logger.close()
         mt5.shutdown()
-        print("MetaTrader5 connection shut down.")
+        logger.info("MetaTrader5 connection shut down.")
 
 
 if __name__ == "__main__":
     # IMPORTANT: Ensure your MT5 terminal is running and you have data for the symbol
-    main_loop(loop_interval=5)
\ No newline at end of file
+    log_listener = _start_log_listener()
+    try:
+        main_loop(loop_interval=5)
+    finally:
+        log_listener.stop()
\ No newline at end of file
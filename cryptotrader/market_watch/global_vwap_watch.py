@@ -1,10 +1,14 @@
 # market_watch/global_vwap_watch.py
 import MetaTrader5 as mt5
-from typing import Dict, Any
+from typing import Dict, Any, Tuple, Optional
 import numpy as np
+import logging
 from core.symbol_data import SymbolData
+from core.jit import njit
 from config.settings import MARKET_WATCH_TIMEFRAME, MARKET_WATCH_BAR_COUNT
 
+logger = logging.getLogger(__name__)
+
 TIMEFRAME_STRINGS = {
     mt5.TIMEFRAME_M1: "M1",
     mt5.TIMEFRAME_M5: "M5",
@@ -13,6 +17,99 @@ TIMEFRAME_STRINGS = {
     mt5.TIMEFRAME_D1: "D1",
 }
 
+# One log record per analysis (see GlobalVwapWatch.print_analysis)
+ANALYSIS_TEMPLATE = ("Symbol: %s @ %s | Price: %.4f | VWAP: %.4f | Trend: **%s** | Bias: **%s** | "
+                     "S/R: S=%.4f, R=%.4f | CONFIRMATION: **%s**")
+
+# VWAP slope is measured against the value this many bars back
+VWAP_SLOPE_LOOKBACK = 10
+
+# Confirmation for each (trend, bias): STRONG when the VWAP slope agrees with the price side,
+# WEAK when only the price side is known (e.g. price above VWAP but VWAP flat/down is a "weak buy")
+CONFIRMATION_TABLE = {
+    ("UPTREND", "BULLISH"): "STRONG_BUY",     ("UPTREND", "BEARISH"): "WEAK_SELL",
+    ("DOWNTREND", "BULLISH"): "WEAK_BUY",     ("DOWNTREND", "BEARISH"): "STRONG_SELL",
+    ("CONSOLIDATION", "BULLISH"): "WEAK_BUY", ("CONSOLIDATION", "BEARISH"): "WEAK_SELL",
+}
+
+# Bars covered by the support/resistance levels (as in SymbolData.calculate_support_resistance)
+SR_LOOKBACK_PERIOD = 50
+
+def window_vwap_trend(high: np.ndarray, low: np.ndarray, close: np.ndarray, volume: np.ndarray, 
+                      bar_count: int = MARKET_WATCH_BAR_COUNT) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized VWAP/trend for every bar of a series at once (used for backtesting).
+    Bar e gets the values analyze_market reports for the bar_count window ending at e.
+    
+    :return: (vwap, trend) arrays. trend is 1 (UPTREND), -1 (DOWNTREND) or 0 (CONSOLIDATION);
+             vwap is NaN where the window has no volume (analyze_market reports ERROR).
+    """
+    typical_price = (high + low + close) / 3
+    cum_tpv = np.concatenate(([0.0], np.cumsum(typical_price * volume)))
+    cum_vol = np.concatenate(([0.0], np.cumsum(volume)))
+    end = np.arange(len(close))
+    start = np.maximum(0, end - bar_count + 1)
+
+    def vwap_through(prefix_idx: np.ndarray) -> np.ndarray:
+        # VWAP anchored at each window start, through prefix position prefix_idx
+        cum_volume = cum_vol[prefix_idx] - cum_vol[start]
+        return (cum_tpv[prefix_idx] - cum_tpv[start]) / np.where(cum_volume == 0, np.nan, cum_volume)
+
+    vwap = vwap_through(end + 1)
+    has_slope = end - start + 1 > VWAP_SLOPE_LOOKBACK
+    vwap_change = vwap - vwap_through(np.where(has_slope, end + 2 - VWAP_SLOPE_LOOKBACK, end + 1))
+    trend = np.where(has_slope & (vwap_change > 0), 1, np.where(has_slope & (vwap_change < 0), -1, 0)).astype(np.int8)
+    return vwap, trend
+
+@njit(cache=True)
+def analyze_window(high: np.ndarray, low: np.ndarray, close: np.ndarray, volume: np.ndarray, 
+                   slope_lookback: int, sr_lookback: int) -> Tuple[float, ...]:
+    """
+    One compiled pass over an analysis window (last bar = forming bar). Returns VWAP sums rather than
+    ratios so the caller decides how to treat zero volume:
+    
+    (tpv, vol): TP*Volume and Volume summed over the whole window (current VWAP = tpv / vol)
+    (lag_tpv, lag_vol): the same sums through the bar slope_lookback bars back (the lagged VWAP)
+    (closed_tpv, closed_vol): the same sums over the closed bars (all but the last)
+    (support, resistance): low/high extremes of the last sr_lookback bars
+    (closed_low, closed_high): the same extremes excluding the last bar (inf/-inf if there is none)
+    """
+    n = len(close)
+    lag_idx = n - slope_lookback
+    sr_start = max(0, n - sr_lookback)
+    tpv = vol = lag_tpv = lag_vol = closed_tpv = closed_vol = 0.0
+    closed_low, closed_high = np.inf, -np.inf
+    for i in range(n):
+        if i == n - 1:
+            closed_tpv, closed_vol = tpv, vol
+        tpv += (high[i] + low[i] + close[i]) / 3 * volume[i]
+        vol += volume[i]
+        if i == lag_idx:
+            lag_tpv, lag_vol = tpv, vol
+        if sr_start <= i < n - 1:
+            closed_low = min(closed_low, low[i])
+            closed_high = max(closed_high, high[i])
+    support = min(closed_low, low[n - 1])
+    resistance = max(closed_high, high[n - 1])
+    return tpv, vol, lag_tpv, lag_vol, closed_tpv, closed_vol, support, resistance, closed_low, closed_high
+
+class VwapAcc:
+    """
+    Running state of one (symbol, timeframe) analysis window. Sums over the closed bars are
+    taken once per new bar, so a tick on the forming (last) bar is folded in with O(1) work.
+    """
+    
+    def __init__(self, last_bar_time, last_tick: tuple, closed_tpv: float, closed_vol: float, 
+                 lag_vwap: Optional[float], closed_low: float, closed_high: float, market_state: Dict[str, Any]):
+        self.last_bar_time = last_bar_time # Open time of the forming bar
+        self.last_tick = last_tick         # (close, tick_volume) of the forming bar at the last analysis
+        self.closed_tpv = closed_tpv       # Sum of TP * Volume over the closed bars of the window
+        self.closed_vol = closed_vol       # Sum of Volume over the closed bars of the window
+        self.lag_vwap = lag_vwap           # VWAP VWAP_SLOPE_LOOKBACK bars back (None if the window is too short)
+        self.closed_low = closed_low       # Lowest low of the closed bars in the S/R lookback
+        self.closed_high = closed_high     # Highest high of the closed bars in the S/R lookback
+        self.market_state = market_state
+
 class GlobalVwapWatch:
     """
     Analyzes the market based on VWAP, price action, and support/resistance 
@@ -23,6 +120,9 @@ class GlobalVwapWatch:
         self.symbol_data = symbol_data
         self.timeframe = MARKET_WATCH_TIMEFRAME
         self.bar_count = MARKET_WATCH_BAR_COUNT
+        # Incremental analysis state, rebuilt from the full window whenever a new bar opens
+        # Format: {(symbol, timeframe): VwapAcc}
+        self._vwap_state: Dict[Tuple[str, int], VwapAcc] = {}
         
     def analyze_market(self, symbol: str) -> Dict[str, Any]:
         """
@@ -32,29 +132,79 @@ class GlobalVwapWatch:
         :return: A dictionary containing the market state and confirmation.
         """
         
-        # 1. Fetch Data
-        df = self.symbol_data.get_ohlc_bars(symbol, self.timeframe, self.bar_count)
+        # 1. Fetch only the forming bar; the full window is needed only when a new bar has opened
+        latest = self.symbol_data.get_ohlc_arrays(symbol, self.timeframe, 1)
         
-        if df is None or df.empty:
+        if latest is None or len(latest[0]) == 0:
             # If data fetch failed (e.g., symbol not found)
             return self._default_market_state(symbol)
+        bar_time, high, low, close, volume = (field[-1] for field in latest)
 
-        # 2. Calculate VWAP
-        vwap_array = self.symbol_data.calculate_vwap(df)
-        if vwap_array is None or len(vwap_array) == 0:
-            return {"trend": "ERROR", "confirmation": "NEUTRAL", "vwap": None, "current_price": df['close'].iloc[-1]}
-            
-        current_price = df['close'].iloc[-1]
-        current_vwap = vwap_array[-1]
+        acc = self._vwap_state.get((symbol, self.timeframe))
+        if acc is None or acc.last_bar_time != bar_time:
+            return self._analyze_window(symbol)
+
+        # Same forming bar: reuse the analysis if no tick has arrived since, else update it in O(1)
+        tick = (close, volume)
+        if tick != acc.last_tick:
+            acc.last_tick = tick
+            acc.market_state = self._update_forming_bar(symbol, acc, high, low, close, volume)
+        return dict(acc.market_state)
+
+    def _analyze_window(self, symbol: str) -> Dict[str, Any]:
+        """Full analysis of the bar_count window; also rebuilds the incremental state for the symbol."""
+        bars = self.symbol_data.get_ohlc_arrays(symbol, self.timeframe, self.bar_count)
+        
+        if bars is None or len(bars[0]) == 0:
+            return self._default_market_state(symbol)
+        times, high, low, close, volume = bars
+
+        # 2. VWAP sums and Support/Resistance levels in one compiled pass
+        (tpv, vol, lag_tpv, lag_vol, closed_tpv, closed_vol, 
+         support, resistance, closed_low, closed_high) = analyze_window(
+            high, low, close, volume, VWAP_SLOPE_LOOKBACK, SR_LOOKBACK_PERIOD)
+        
+        current_price = close[-1]
+        if vol == 0:
+            return {"trend": "ERROR", "confirmation": "NEUTRAL", "vwap": None, "current_price": current_price}
+        current_vwap = tpv / vol
+        # VWAP Slope: Compare the last N VWAP values (e.g., last 10)
+        lag_vwap = lag_tpv / lag_vol if len(close) > VWAP_SLOPE_LOOKBACK and lag_vol != 0 else None
         
+        market_state = self._market_state(symbol, current_price, current_vwap, lag_vwap, support, resistance)
+
+        # Closed-bar sums for the ticks that arrive before the next bar opens
+        self._vwap_state[(symbol, self.timeframe)] = VwapAcc(
+            last_bar_time=times[-1], last_tick=(current_price, volume[-1]),
+            closed_tpv=closed_tpv, closed_vol=closed_vol, lag_vwap=lag_vwap,
+            closed_low=closed_low, closed_high=closed_high, market_state=market_state)
+        return dict(market_state)
+
+    def _update_forming_bar(self, symbol: str, acc: VwapAcc, high: float, low: float, 
+                            current_price: float, volume: float) -> Dict[str, Any]:
+        """Market state after a tick on the forming bar, from the closed-bar sums in acc."""
+        total_vol = acc.closed_vol + volume
+        if total_vol == 0:
+            return {"trend": "ERROR", "confirmation": "NEUTRAL", "vwap": None, "current_price": current_price}
+        current_vwap = (acc.closed_tpv + (high + low + current_price) / 3 * volume) / total_vol
+        
+        return self._market_state(symbol, current_price, current_vwap, acc.lag_vwap, 
+                                  min(acc.closed_low, low), max(acc.closed_high, high))
+
+    def _default_market_state(self, symbol: str) -> Dict[str, Any]:
+        """Market state when no bars could be fetched (no VWAP, so strategies take no trade)."""
+        return {"symbol": symbol, "timeframe": self.timeframe, "trend": "ERROR", 
+                "confirmation": "NEUTRAL", "vwap": None, "current_price": None}
+
+    def _market_state(self, symbol: str, current_price: float, current_vwap: float, lag_vwap: Optional[float], 
+                      support: float, resistance: float) -> Dict[str, Any]:
+        """Trend, bias and confirmation from the current VWAP, its lagged value and the S/R levels."""
         # 3. Determine Trend and Bias (VWAP Logic)
         trend = "CONSOLIDATION"
         bias = "NEUTRAL"
         
-        # VWAP Slope: Compare the last N VWAP values (e.g., last 10)
-        vwap_lookback = 10
-        if len(vwap_array) > vwap_lookback:
-            vwap_change = vwap_array[-1] - vwap_array[-vwap_lookback]
+        if lag_vwap is not None:
+            vwap_change = current_vwap - lag_vwap
             
             if vwap_change > 0:
                 trend = "UPTREND"
@@ -67,27 +217,13 @@ class GlobalVwapWatch:
             bias = "BULLISH"
         elif current_price < current_vwap:
             bias = "BEARISH"
-            
-        # 4. Determine Support and Resistance (using utility placeholders)
-        sr_levels = self.symbol_data.calculate_support_resistance(df)
-        support = sr_levels.get("support", 0.0)
-        resistance = sr_levels.get("resistance", 0.0)
         
         # 5. Confirmation Logic (Combining Trend and Bias)
-        confirmation = "NEUTRAL"
-        
-        if trend == "UPTREND" and bias == "BULLISH":
-            # Price above VWAP AND VWAP sloping up
-            confirmation = "STRONG_BUY"
-        elif trend == "DOWNTREND" and bias == "BEARISH":
-            # Price below VWAP AND VWAP sloping down
-            confirmation = "STRONG_SELL"
-        elif trend == "CONSOLIDATION" and (current_price < support or current_price > resistance):
+        if trend == "CONSOLIDATION" and (current_price < support or current_price > resistance):
             # Price near S/R in consolidation is often considered neutral or a range trade setup
             confirmation = "NEUTRAL" 
-        elif bias != "NEUTRAL":
-            # Price above VWAP but VWAP is flat/down (e.g., "weak buy")
-            confirmation = "WEAK_BUY" if bias == "BULLISH" else "WEAK_SELL"
+        else:
+            confirmation = CONFIRMATION_TABLE.get((trend, bias), "NEUTRAL")
 
 
         # 6. Return the Market State Dictionary
@@ -105,13 +241,13 @@ class GlobalVwapWatch:
 
     # Helper function to print the result cleanly
     def print_analysis(self, result: Dict[str, Any]):
-        """Prints the market analysis result in a clean format."""
+        """Logs the market analysis result in a clean format (nothing is formatted unless INFO is enabled)."""
+        if not logger.isEnabledFor(logging.INFO):
+            return
         tf_str = TIMEFRAME_STRINGS.get(result['timeframe'], str(result['timeframe']))
         
-        print("--- Market Watch Analysis ---")
-        print(f"Symbol: {result['symbol']} @ {tf_str}")
-        print(f"Price: {result['current_price']:.4f} | VWAP: {result['vwap']:.4f}")
-        print(f"Trend: **{result['trend']}** | Bias: **{result['bias']}**")
-        print(f"S/R: S={result['support']:.4f}, R={result['resistance']:.4f}")
-        print(f"CONFIRMATION: **{result['confirmation']}**")
-        print("-----------------------------")
\ No newline at end of file
+        logger.debug("--- Market Watch Analysis ---")
+        # Arguments are interpolated only if a handler accepts the record
+        logger.info(ANALYSIS_TEMPLATE, result['symbol'], tf_str, result['current_price'], result['vwap'], 
+                    result['trend'], result['bias'], result['support'], result['resistance'], result['confirmation'])
+        logger.debug("-----------------------------")
\ No newline at end of file
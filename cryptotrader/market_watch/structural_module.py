@@ -2,16 +2,21 @@ import pandas as pd
 import numpy as np
 from typing import Dict, Any, Tuple
 import MetaTrader5 as mt5
+from core.jit import njit
 
 # --- HELPER FUNCTIONS ---
 
 def calculate_true_range(df: pd.DataFrame) -> pd.Series:
     """Calculates the True Range (TR) for volatility."""
-    high_low = df['high'] - df['low']
-    high_prev_close = np.abs(df['high'] - df['close'].shift(1))
-    low_prev_close = np.abs(df['low'] - df['close'].shift(1))
-    tr = pd.concat([high_low, high_prev_close, low_prev_close], axis=1).max(axis=1)
-    return tr
+    high = np.ascontiguousarray(df['high'].to_numpy(dtype=float))
+    low = np.ascontiguousarray(df['low'].to_numpy(dtype=float))
+    close = df['close'].to_numpy(dtype=float)
+    # Previous close; the first bar uses its own high, which reduces its TR to high - low
+    prev_close = np.empty_like(high)
+    prev_close[:1] = high[:1]
+    prev_close[1:] = close[:-1]
+    tr = np.maximum.reduce([high - low, np.abs(high - prev_close), np.abs(low - prev_close)])
+    return pd.Series(tr, index=df.index)
 
 def calculate_atr(df: pd.DataFrame, period: int) -> pd.Series:
     """Calculates the Average True Range (ATR)."""
@@ -19,15 +24,59 @@ def calculate_atr(df: pd.DataFrame, period: int) -> pd.Series:
     # Use exponential smoothing (standard for ATR)
     return tr.ewm(span=period, adjust=False).mean()
 
-def calculate_vwap_series(df: pd.DataFrame) -> pd.Series:
-    """Calculates the Volume Weighted Average Price (VWAP) as a cumulative series."""
+@njit(cache=True, fastmath=True)
+def atr_zscore(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int, zscore_period: int) -> float:
+    """
+    Z-Score of the last ATR against the zscore_period ATRs before it, in one pass over the bars.
+    Same ATR as calculate_atr (TR smoothed with ewm(span=period, adjust=False)); needs
+    at least zscore_period + 1 bars. Returns 0.0 when the ATR history has no spread.
+    """
+    n = len(close)
+    alpha = 2.0 / (period + 1)
+    first = n - zscore_period - 1 # Bar of the oldest ATR in the Z-Score window
+    recent_atr = np.empty(zscore_period)
+    atr = 0.0
+    for i in range(n):
+        if i == 0:
+            atr = high[0] - low[0]
+        else:
+            prev_close = close[i - 1]
+            tr = max(high[i] - low[i], abs(high[i] - prev_close), abs(low[i] - prev_close))
+            atr = alpha * tr + (1.0 - alpha) * atr
+        if first <= i < n - 1:
+            recent_atr[i - first] = atr
+
+    # Sample mean/std (ddof=1, as pandas) of the ATRs BEFORE the current bar
+    mean_atr = 0.0
+    for k in range(zscore_period):
+        mean_atr += recent_atr[k]
+    mean_atr /= zscore_period
+    var_atr = 0.0
+    for k in range(zscore_period):
+        var_atr += (recent_atr[k] - mean_atr) ** 2
+    var_atr /= zscore_period - 1
+    if var_atr == 0.0:
+        return 0.0
+    return (atr - mean_atr) / np.sqrt(var_atr)
+
+def _vwap_arrays(high: np.ndarray, low: np.ndarray, close: np.ndarray, 
+                 volume: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Returns (typical price, volume, cumulative volume, VWAP) as float arrays."""
     # Use Typical Price (H+L+C)/3
-    df['tp'] = (df['high'] + df['low'] + df['close']) / 3
-    df['tp_vol'] = df['tp'] * df['tick_volume']
+    tp = (high + low + close) / 3
+    volume = np.asarray(volume, dtype=float)
+    cum_volume = np.cumsum(volume)
     
     # VWAP is the cumulative sum of (TP * Volume) / cumulative sum of Volume
-    vwap_series = df['tp_vol'].cumsum() / df['tick_volume'].cumsum()
-    return vwap_series
+    # (NaN while no volume has traded yet, as with the pandas division)
+    vwap = np.cumsum(tp * volume) / np.where(cum_volume == 0, np.nan, cum_volume)
+    return tp, volume, cum_volume, vwap
+
+def calculate_vwap_series(df: pd.DataFrame) -> pd.Series:
+    """Calculates the Volume Weighted Average Price (VWAP) as a cumulative series."""
+    vwap = _vwap_arrays(df['high'].to_numpy(dtype=float), df['low'].to_numpy(dtype=float), 
+                        df['close'].to_numpy(dtype=float), df['tick_volume'].to_numpy(dtype=float))[3]
+    return pd.Series(vwap, index=df.index)
 
 # ----------------------------------------------------------------------
 # MODULE 1: VOLATILITY REGIME DETECTION (ATR Z-Score)
@@ -48,34 +97,15 @@ class VolatilityRegimeModule:
         or ranging (low vol) relative to its recent history.
         """
         # Fetch enough data for the long ZSCORE_PERIOD
-        df = self.symbol_data.get_ohlc_bars(symbol, timeframe, self.DATA_BARS)
+        bars = self.symbol_data.get_ohlc_arrays(symbol, timeframe, self.DATA_BARS)
         
-        if df is None or len(df) < self.DATA_BARS:
+        if bars is None or len(bars[0]) < self.DATA_BARS:
             return 0.0 # Default to neutral
             
-        # 1. Calculate the ATR series
-        atr_series = calculate_atr(df, self.ATR_PERIOD)
-        
-        # We need enough ATR values for the ZSCORE_PERIOD
-        if len(atr_series.dropna()) < self.ZSCORE_PERIOD:
-             return 0.0
-
-        # 2. Calculate Mean and Standard Deviation over the ZSCORE_PERIOD
-        # We look at the ATR values BEFORE the current bar for stable stats
-        recent_atr = atr_series.iloc[-self.ZSCORE_PERIOD-1:-1]
-        
-        mean_atr = recent_atr.mean()
-        std_atr = recent_atr.std()
-        current_atr = atr_series.iloc[-1]
-        
-        # Avoid division by zero
-        if std_atr == 0:
-            return 0.0
-            
-        # 3. Calculate the ATR Z-Score
-        atr_zscore = (current_atr - mean_atr) / std_atr
-        
-        return atr_zscore
+        # ATR series, its Mean/StdDev over the ZSCORE_PERIOD bars before the current one,
+        # and the current ATR's Z-Score, all in one compiled pass
+        _, high, low, close, _ = bars
+        return float(atr_zscore(high, low, close, self.ATR_PERIOD, self.ZSCORE_PERIOD))
 
 # ----------------------------------------------------------------------
 # MODULE 2: LIQUIDITY AND VOLUME STRUCTURE (VWAP Bands)
@@ -96,29 +126,28 @@ class VwapStructureModule:
         Returns the last VWAP and its +1/+2 SD bands.
         """
         
-        # Fetch the data. Ensure it has 'tick_volume'
-        df = self.symbol_data.get_ohlc_bars(symbol, self.TIMEFRAME, num_bars)
+        # Fetch the data (time, high, low, close, tick_volume arrays)
+        bars = self.symbol_data.get_ohlc_arrays(symbol, self.TIMEFRAME, num_bars)
         
-        # Check for required columns
-        if df is None or 'tick_volume' not in df.columns or len(df) < 2:
+        # Check for enough bars
+        if bars is None or len(bars[0]) < 2:
             return {"VWAP": np.nan, "SD1_P": np.nan, "SD2_P": np.nan, "SD1_N": np.nan, "SD2_N": np.nan}
         
-        # 1. Calculate VWAP series
-        vwap_series = calculate_vwap_series(df)
-        last_vwap = vwap_series.iloc[-1]
+        # 1. Calculate the VWAP series
+        tp, volume, cum_volume, vwap = _vwap_arrays(*bars[1:])
+        last_vwap = vwap[-1]
         
         # 2. Calculate the volume-weighted standard deviation (VSD)
         
-        # Calculate Typical Price and deviations
-        df['tp'] = (df['high'] + df['low'] + df['close']) / 3
-        
-        # Calculate deviation of TP from VWAP
-        df['deviation'] = df['tp'] - vwap_series
-        df['dev_sq_vol'] = (df['deviation'] ** 2) * df['tick_volume']
+        # Deviation of TP from the running VWAP
+        deviation = tp - vwap
         
-        # VSD is sqrt( (Cumulative Sum of (Dev^2 * Vol)) / (Cumulative Sum of Vol) )
-        vsd_series = np.sqrt(df['dev_sq_vol'].cumsum() / df['tick_volume'].cumsum())
-        last_vsd = vsd_series.iloc[-1]
+        # VSD is sqrt( (Sum of (Dev^2 * Vol)) / (Sum of Vol) ); only the last value is used.
+        # Leading zero-volume bars have a NaN VWAP and are skipped, as pandas cumsum does.
+        if cum_volume[-1] == 0:
+            last_vsd = np.nan
+        else:
+            last_vsd = np.sqrt(np.nansum(deviation * deviation * volume) / cum_volume[-1])
         
         # 3. Define Bands
         
@@ -1,8 +1,16 @@
 # persistence/trade_log.py
 
 import csv
+import os
+import threading
 from datetime import datetime
 import MetaTrader5 as mt5
+
+HEADERS = (
+    "Timestamp", "Action", "Ticket", "Symbol", "Side", 
+    "Volume", "Price", "SL", "TP", "Comment", "Status", "Details"
+)
+
 class TradeLog:
     """
     Handles logging of trade requests, execution results, and PnL actions.
@@ -10,29 +18,34 @@ class TradeLog:
     
     def __init__(self, filename="trades.csv"):
         self.filename = filename
+        self._lock = threading.Lock() # Symbols are processed on a thread pool; one writer at a time
         self._ensure_file_exists()
+        # Kept open for the bot's lifetime; line buffering flushes each record as it is written
+        self._fh = open(self.filename, 'a', newline='', buffering=1)
+        self._writer = csv.writer(self._fh)
+
+    def close(self):
+        """Flushes and closes the log file."""
+        with self._lock:
+            if not self._fh.closed:
+                self._fh.close()
+
+    def __del__(self):
+        if getattr(self, '_fh', None) is not None:
+            self.close()
 
     def _ensure_file_exists(self):
         """Creates the CSV file with headers if it doesn't exist."""
-        try:
-            with open(self.filename, 'r', newline='') as f:
-                # Check if file has content (i.e., headers)
-                if not f.read(1):
-                    raise FileNotFoundError
-        except FileNotFoundError:
+        # Check if file has content (i.e., headers)
+        if not (os.path.exists(self.filename) and os.path.getsize(self.filename) > 0):
             with open(self.filename, 'w', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    "Timestamp", "Action", "Ticket", "Symbol", "Side", 
-                    "Volume", "Price", "SL", "TP", "Comment", "Status", "Details"
-                ])
+                csv.writer(f).writerow(HEADERS)
                 
     def _log(self, action, ticket, symbol, side, volume, price, sl, tp, comment, status, details=""):
         """Internal method to write a record to the CSV."""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        with open(self.filename, 'a', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow([
+        with self._lock:
+            self._writer.writerow([
                 timestamp, action, ticket, symbol, side, 
                 volume, price, sl, tp, comment, status, details
             ])
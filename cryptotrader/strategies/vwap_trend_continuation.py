@@ -4,21 +4,62 @@ from core.trade_manager import TradeManager
 from core.symbol_data import SymbolData
 # CRITICAL FIX: Import the shared timeframe setting
 from config.settings import DEFAULT_VOLUME, MT5_MAGIC_NUMBER, MARKET_WATCH_TIMEFRAME 
+from market_watch.global_vwap_watch import window_vwap_trend
+from core.jit import njit, NUMBA_AVAILABLE
 from typing import Dict, Any, Optional
+import numpy as np
 
 # Unique Magic Number for this strategy
 STRATEGY_MAGIC = MT5_MAGIC_NUMBER + 1 
 
+# --- Batch Decision Kernels ---
+
+def _decide_loop(trend: np.ndarray, vwap: np.ndarray, price: np.ndarray, 
+                 high: np.ndarray, low: np.ndarray) -> np.ndarray:
+    """
+    VwapTrendContinuation._decide over arrays, with trend as window_vwap_trend codes
+    (1 up, -1 down, 0 otherwise). Returns int8 1 ("buy"), -1 ("sell") or 0 (None) per element.
+    """
+    signals = np.zeros(len(trend), dtype=np.int8)
+    for i in range(len(trend)):
+        # --- BUY BOUNCE/CONTINUATION ---
+        # Uptrend, the bar's low touched VWAP (low <= VWAP) and it closed *above* VWAP
+        if trend[i] == 1 and low[i] <= vwap[i] and price[i] > vwap[i]:
+            signals[i] = 1
+        # --- SELL BOUNCE/CONTINUATION ---
+        # Downtrend, the bar's high touched VWAP (high >= VWAP) and it closed *below* VWAP
+        elif trend[i] == -1 and high[i] >= vwap[i] and price[i] < vwap[i]:
+            signals[i] = -1
+    return signals
+
+# The only copy of the entry rule: compiled when numba is installed, a plain loop otherwise
+decide_batch = njit(cache=True)(_decide_loop) if NUMBA_AVAILABLE else _decide_loop
+
+# str trend (GlobalVwapWatch market state) -> window_vwap_trend code, and signal code -> side
+_TREND_CODES = {"UPTREND": 1, "DOWNTREND": -1}
+_SIDES = {1: "buy", -1: "sell"}
+
 class VwapTrendContinuation:
     """
     VWAP Trend Continuation (The "Bounce" Strategy):
     Trades placed on a pullback to the VWAP line within a confirmed strong trend.
     (Entry logic fixed to use a more robust "touch and close" condition)
     """
+    __slots__ = ("trade_manager", "symbol_data", "volume", "timeframe", "_signal_bar_time", "_order_templates")
+
     def __init__(self, trade_manager: TradeManager, symbol_data: SymbolData):
         self.trade_manager = trade_manager
         self.symbol_data = symbol_data
         self.volume = DEFAULT_VOLUME
+        self.timeframe = MARKET_WATCH_TIMEFRAME # Same bars as the GlobalVwapWatch analysis
+        # Open time of the last bar that produced a signal, per symbol
+        # Format: {symbol: bar_time}
+        self._signal_bar_time: Dict[str, int] = {}
+        # enqueue_order keyword arguments per side, built once
+        self._order_templates: Dict[str, Dict[str, Any]] = {
+            "buy": dict(side="buy", volume=self.volume, comment="VWAP_BOUNCE_BUY", magic=STRATEGY_MAGIC),
+            "sell": dict(side="sell", volume=self.volume, comment="VWAP_BOUNCE_SELL", magic=STRATEGY_MAGIC),
+        }
         
     def check_for_entry(self, symbol: str, market_state: Dict[str, Any], open_positions: tuple) -> Optional[str]:
         """
@@ -29,63 +70,66 @@ class VwapTrendContinuation:
         if open_positions:
             return None 
 
-        trend = market_state.get('trend')
-        vwap = market_state.get('vwap')
-        current_price = market_state.get('current_price')
+        # Every market state (including the ERROR ones) carries these keys
+        trend, vwap, current_price = market_state['trend'], market_state['vwap'], market_state['current_price']
         
         # Check for invalid indicator data
         if vwap is None or current_price is None:
             return None
         
-        # 1. Get the current bar's OHLC data to check the 'touch' (Count=2 ensures we get the current bar's full data)
-        df = self.symbol_data.get_ohlc_bars(symbol, timeframe=MARKET_WATCH_TIMEFRAME, count=2) 
+        # A bar gives at most one signal: once it has, later checks on it return right away.
+        # (The bar time comes from the one-bar fetch GlobalVwapWatch already made this cycle.)
+        symbol_data, timeframe = self.symbol_data, self.timeframe
+        bar_time = symbol_data.get_last_bar_time(symbol, timeframe)
+        if bar_time is not None and self._signal_bar_time.get(symbol) == bar_time:
+            return None
+        
+        # 1. Get the current bar's high/low to check the 'touch' (None unless the bar history has 2+ bars)
+        last_bar = symbol_data.get_last_bar_hl(symbol, timeframe)
         
-        if df.empty or len(df) < 2:
+        if last_bar is None:
             return None
 
-        current_bar = df.iloc[-1]
-        current_high = current_bar['high']
-        current_low = current_bar['low']
+        current_high, current_low, _ = last_bar
         
-        # --- BUY BOUNCE/CONTINUATION ---
-        # 1. Must be in an uptrend ("UPTREND")
-        # 2. Price must have touched VWAP (current bar's low <= VWAP)
-        # 3. Bar must have closed *above* VWAP for confirmation
-        if (trend == "UPTREND" and 
-            current_low <= vwap and 
-            current_price > vwap):
-            # 
-            return "buy"
-            
-        # --- SELL BOUNCE/CONTINUATION ---
-        # 1. Must be in a downtrend ("DOWNTREND")
-        # 2. Price must have touched VWAP (current bar's high >= VWAP)
-        # 3. Bar must have closed *below* VWAP for confirmation
-        elif (trend == "DOWNTREND" and 
-              current_high >= vwap and 
-              current_price < vwap):
-            # 
-            return "sell"
-            
-        return None
+        side = self._decide(trend, vwap, current_price, current_high, current_low)
+        if side is not None:
+            self._signal_bar_time[symbol] = bar_time
+        return side
+
+    @staticmethod
+    def _decide(trend: Optional[str], vwap: float, current_price: float, 
+                current_high: float, current_low: float) -> Optional[str]:
+        """The entry rule on plain values (no MT5 or position state): "buy", "sell" or None."""
+        # Evaluated by decide_batch on one-element arrays, so the rule is defined only once
+        code = decide_batch(np.array([_TREND_CODES.get(trend, 0)], dtype=np.int8),
+                            np.array([vwap], dtype=np.float64),
+                            np.array([current_price], dtype=np.float64),
+                            np.array([current_high], dtype=np.float64),
+                            np.array([current_low], dtype=np.float64))[0]
+        return _SIDES.get(int(code))
+
+    @classmethod
+    def vectorize(cls, high: np.ndarray, low: np.ndarray, close: np.ndarray, volume: np.ndarray) -> np.ndarray:
+        """
+        Vectorized check_for_entry over a whole backtest series.
+        
+        signal[i] is what check_for_entry returns on backtest bar i: the market state comes from
+        the window closing at bar i-1 and the VWAP touch is checked on bar i. The single position
+        constraint is not applied here; the caller only acts on signals while flat.
+        
+        :return: int8 array of 1 ("buy"), -1 ("sell") or 0 (None) per bar.
+        """
+        vwap, trend = window_vwap_trend(high, low, close, volume)
+
+        signals = np.zeros(len(close), dtype=np.int8)
+        signals[1:] = decide_batch(trend[:-1], vwap[:-1], close[:-1], high[1:], low[1:])
+        return signals
 
     def place_order(self, symbol: str, side: str):
         """
-        Executes the trade using the TradeManager. (Live Trading)
+        Queues the trade on the TradeManager; main_loop sends it with flush() at the end of the cycle. (Live Trading)
         """
-        if side == "buy":
-            self.trade_manager.place_order(
-                symbol=symbol,
-                side="buy",
-                volume=self.volume,
-                comment="VWAP_BOUNCE_BUY",
-                magic=STRATEGY_MAGIC
-            )
-        elif side == "sell":
-            self.trade_manager.place_order(
-                symbol=symbol,
-                side="sell",
-                volume=self.volume,
-                comment="VWAP_BOUNCE_SELL",
-                magic=STRATEGY_MAGIC
-            )
\ No newline at end of file
+        order = self._order_templates.get(side)
+        if order is not None:
+            self.trade_manager.enqueue_order(symbol=symbol, **order)
\ No newline at end of file